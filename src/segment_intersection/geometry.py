@@ -71,12 +71,20 @@ def segment_intersection(s1: Segment, s2: Segment, eps: float = EPS) -> Intersec
     - SegmentIntersection: część wspólna jest odcinkiem (współliniowość i nakładanie).
 
     Implementacja jest odporna na typowe błędy numeryczne (epsilon).
+    Odcinek zdegenerowany (długość ~0) jest traktowany jak punkt.
     """
     p = s1.a
     r = Point(s1.b.x - s1.a.x, s1.b.y - s1.a.y)
     q = s2.a
     s = Point(s2.b.x - s2.a.x, s2.b.y - s2.a.y)
 
+    # Przypadek: odcinek zdegenerowany do punktu - bez tego trafiłby do gałęzi
+    # współliniowej i "przecinał" każdy odcinek o nachodzącym rzucie.
+    if _almost_zero(r.x, eps) and _almost_zero(r.y, eps):
+        return PointIntersection(p) if point_on_segment(p, s2, eps) else NoIntersection()
+    if _almost_zero(s.x, eps) and _almost_zero(s.y, eps):
+        return PointIntersection(q) if point_on_segment(q, s1, eps) else NoIntersection()
+
     rxs = _cross(r.x, r.y, s.x, s.y)
     q_p = Point(q.x - p.x, q.y - p.y)
     qpxr = _cross(q_p.x, q_p.y, r.x, r.y)
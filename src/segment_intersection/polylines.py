@@ -0,0 +1,235 @@
+from __future__ import annotations
+
+import math
+from bisect import bisect_left, bisect_right
+from dataclasses import dataclass
+from typing import Optional, Sequence
+
+from .geometry import (
+    EPS,
+    Intersection,
+    NoIntersection,
+    segment_intersection,
+)
+from .models import Point, Segment
+
+
+@dataclass(frozen=True, slots=True)
+class PolylineHit:
+    """Przecięcie krawędzi `a` łamanej `i` (zbiór A) z krawędzią `b` łamanej `j` (zbiór B).
+
+    Krawędź `a` łączy wierzchołki `a` i `a + 1` łamanej.
+    """
+    i: int
+    a: int
+    j: int
+    b: int
+    result: Intersection
+
+
+@dataclass(frozen=True, slots=True)
+class _Chain:
+    """Fragment łamanej monotoniczny względem x.
+
+    Krawędzie są ułożone rosnąco po x, więc zarówno xmins, jak i xmaxs są posortowane.
+    max_len to długość najdłuższej krawędzi (potrzebna do marginesu tolerancji).
+    """
+    poly: int
+    edges: list[int]
+    xmins: list[float]
+    xmaxs: list[float]
+    bbox: tuple[float, float, float, float]
+    max_len: float
+
+
+def _check_buffers(coords: Sequence[float], offsets: Sequence[int]) -> None:
+    if len(coords) % 2 != 0:
+        raise ValueError("bufor współrzędnych musi mieć parzystą długość (x0, y0, x1, y1, ...)")
+    if len(offsets) == 0 or offsets[0] != 0:
+        raise ValueError("offsets musi zaczynać się od 0")
+    if offsets[-1] != len(coords) // 2:
+        raise ValueError("ostatni offset musi być równy liczbie wierzchołków")
+    for k in range(1, len(offsets)):
+        if offsets[k] < offsets[k - 1]:
+            raise ValueError("offsets musi być niemalejący")
+
+
+def _bbox_overlap(p: tuple[float, float, float, float], q: tuple[float, float, float, float], eps: float) -> bool:
+    return (
+        p[0] <= q[2] + eps and q[0] <= p[2] + eps
+        and p[1] <= q[3] + eps and q[1] <= p[3] + eps
+    )
+
+
+def _segment_bbox(s: Segment) -> tuple[float, float, float, float]:
+    return min(s.a.x, s.b.x), min(s.a.y, s.b.y), max(s.a.x, s.b.x), max(s.a.y, s.b.y)
+
+
+def _point(coords: Sequence[float], v: int) -> Point:
+    return Point(coords[2 * v], coords[2 * v + 1])
+
+
+def _polyline_bbox(coords: Sequence[float], start: int, stop: int) -> tuple[float, float, float, float]:
+    xs = coords[2 * start:2 * stop:2]
+    ys = coords[2 * start + 1:2 * stop:2]
+    return min(xs), min(ys), max(xs), max(ys)
+
+
+def _edge_length(coords: Sequence[float], v: int) -> float:
+    """Długość krawędzi od wierzchołka v do v + 1."""
+    return math.hypot(coords[2 * v + 2] - coords[2 * v], coords[2 * v + 3] - coords[2 * v + 1])
+
+
+def _monotone_chains(coords: Sequence[float], poly: int, start: int, stop: int) -> list[_Chain]:
+    """Dzieli łamaną (wierzchołki start..stop-1) na łańcuchy monotoniczne względem x.
+
+    Krawędzie pionowe (dx == 0) pasują do każdego kierunku i dołączają do bieżącego łańcucha.
+    """
+    chains: list[_Chain] = []
+    n_edges = stop - start - 1
+    e = 0
+    while e < n_edges:
+        direction = 0
+        first = e
+        while e < n_edges:
+            dx = coords[2 * (start + e + 1)] - coords[2 * (start + e)]
+            d = (dx > 0) - (dx < 0)
+            if d != 0 and direction != 0 and d != direction:
+                break
+            direction = direction or d
+            e += 1
+
+        edges = list(range(first, e))
+        if direction < 0:
+            edges.reverse()
+        xmins: list[float] = []
+        xmaxs: list[float] = []
+        max_len = 0.0
+        for k in edges:
+            x0 = coords[2 * (start + k)]
+            x1 = coords[2 * (start + k + 1)]
+            xmins.append(min(x0, x1))
+            xmaxs.append(max(x0, x1))
+            max_len = max(max_len, _edge_length(coords, start + k))
+        bbox = _polyline_bbox(coords, start + first, start + e + 1)
+        chains.append(_Chain(poly, edges, xmins, xmaxs, bbox, max_len))
+    return chains
+
+
+_Prepared = Optional[tuple[tuple[float, float, float, float], float, list[_Chain]]]
+
+
+def _prepare(coords: Sequence[float], offsets: Sequence[int]) -> list[_Prepared]:
+    """Dla każdej łamanej: (bbox, najdłuższa krawędź, łańcuchy) albo None, gdy nie ma krawędzi."""
+    out: list[_Prepared] = []
+    for poly in range(len(offsets) - 1):
+        start, stop = offsets[poly], offsets[poly + 1]
+        if stop - start < 2:
+            out.append(None)
+            continue
+        chains = _monotone_chains(coords, poly, start, stop)
+        max_len = max(c.max_len for c in chains)
+        out.append((_polyline_bbox(coords, start, stop), max_len, chains))
+    return out
+
+
+def _margin(len_a: float, len_b: float, eps: float) -> float:
+    """Margines, o jaki mogą być odległe prostokąty ograniczające pary krawędzi.
+
+    segment_intersection dopuszcza -eps <= t <= 1 + eps wzdłuż odcinka, czyli przesunięcie
+    rzędu eps * długość poza koniec krawędzi, a nie tylko bezwzględne eps. Marginesy łańcuchów
+    i łamanych liczone z najdłuższej krawędzi są nie mniejsze niż margines każdej ich pary.
+    """
+    return eps * (1.0 + len_a + len_b)
+
+
+def _chain_pair(
+    coords_a: Sequence[float],
+    offsets_a: Sequence[int],
+    ca: _Chain,
+    coords_b: Sequence[float],
+    offsets_b: Sequence[int],
+    cb: _Chain,
+    eps: float,
+    hits: list[PolylineHit],
+) -> None:
+    base_a = offsets_a[ca.poly]
+    base_b = offsets_b[cb.poly]
+
+    # Wspólny zakres x obu łańcuchów zawęża krawędzie łańcucha A.
+    margin = _margin(ca.max_len, cb.max_len, eps)
+    lo = max(ca.bbox[0], cb.bbox[0]) - margin
+    hi = min(ca.bbox[2], cb.bbox[2]) + margin
+    first = bisect_left(ca.xmaxs, lo)
+    last = bisect_right(ca.xmins, hi)
+
+    for k in range(first, last):
+        ea = ca.edges[k]
+        s1 = Segment(_point(coords_a, base_a + ea), _point(coords_a, base_a + ea + 1))
+        box1 = _segment_bbox(s1)
+        len1 = _edge_length(coords_a, base_a + ea)
+        # Krawędzie łańcucha B, których zakres x nachodzi na krawędź ea.
+        edge_margin = _margin(len1, cb.max_len, eps)
+        b_first = bisect_left(cb.xmaxs, ca.xmins[k] - edge_margin)
+        b_last = bisect_right(cb.xmins, ca.xmaxs[k] + edge_margin)
+        for m in range(b_first, b_last):
+            eb = cb.edges[m]
+            s2 = Segment(_point(coords_b, base_b + eb), _point(coords_b, base_b + eb + 1))
+            # Test pary zależy tylko od tych dwóch krawędzi, a nie od reszty łańcucha.
+            pair_margin = _margin(len1, _edge_length(coords_b, base_b + eb), eps)
+            if not _bbox_overlap(box1, _segment_bbox(s2), pair_margin):
+                continue
+            res = segment_intersection(s1, s2, eps)
+            if not isinstance(res, NoIntersection):
+                hits.append(PolylineHit(ca.poly, ea, cb.poly, eb, res))
+
+
+def polyline_intersections(
+    coords_a: Sequence[float],
+    offsets_a: Sequence[int],
+    coords_b: Sequence[float],
+    offsets_b: Sequence[int],
+    eps: float = EPS,
+) -> list[PolylineHit]:
+    """Wyznacza wszystkie przecięcia krawędzi łamanych ze zbioru A z krawędziami łamanych ze zbioru B.
+
+    Łamane są podane jako płaskie bufory współrzędnych (x0, y0, x1, y1, ...) oraz tablica
+    offsets o długości (liczba łamanych + 1): łamana k ma wierzchołki offsets[k]..offsets[k+1]-1.
+
+    Odrzucanie par odbywa się dwustopniowo: najpierw prostokąty ograniczające całych łamanych,
+    potem łańcuchów monotonicznych względem x. Wewnątrz pary łańcuchów krawędzie są posortowane
+    po x, więc krawędzie o pasującym zakresie x znajduje wyszukiwanie binarne zamiast testu
+    każdej krawędzi z każdą.
+
+    Para krawędzi o długościach L1, L2 jest zgłaszana, gdy ich prostokąty ograniczające są odległe
+    o co najwyżej eps * (1 + L1 + L2) i segment_intersection zwraca przecięcie. Wynik zależy więc
+    tylko od samej pary, a nie od podziału na łańcuchy. Ten warunek obejmuje tolerancję
+    segment_intersection wzdłuż odcinka, ale odrzuca jego fałszywe trafienia dla krótkich,
+    prawie równoległych odcinków odległych o więcej niż margines (sprawdzenia iloczynów
+    wektorowych w segment_intersection nie są skalowane długością). Dla takich par wynik może
+    się więc różnić od wywołania segment_intersection na spłaszczonych odcinkach.
+    """
+    _check_buffers(coords_a, offsets_a)
+    _check_buffers(coords_b, offsets_b)
+
+    polys_a = _prepare(coords_a, offsets_a)
+    polys_b = _prepare(coords_b, offsets_b)
+
+    hits: list[PolylineHit] = []
+    for pa in polys_a:
+        if pa is None:
+            continue
+        bbox_a, len_a, chains_a = pa
+        for pb in polys_b:
+            if pb is None:
+                continue
+            bbox_b, len_b, chains_b = pb
+            if not _bbox_overlap(bbox_a, bbox_b, _margin(len_a, len_b, eps)):
+                continue
+            for ca in chains_a:
+                for cb in chains_b:
+                    if _bbox_overlap(ca.bbox, cb.bbox, _margin(ca.max_len, cb.max_len, eps)):
+                        _chain_pair(coords_a, offsets_a, ca, coords_b, offsets_b, cb, eps, hits)
+
+    hits.sort(key=lambda h: (h.i, h.a, h.j, h.b))
+    return hits
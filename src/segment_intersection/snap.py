@@ -0,0 +1,91 @@
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass
+from typing import Iterable
+
+from .geometry import EPS
+from .models import Point
+
+
+@dataclass(frozen=True, slots=True)
+class SnapResult:
+    """Wynik scalania punktów w kanoniczne wierzchołki.
+
+    - vertices: kanoniczne wierzchołki (po jednym na klaster),
+    - clusters: dla każdego wierzchołka indeksy punktów wejściowych, które do niego scalono,
+    - labels: dla każdego punktu wejściowego indeks jego wierzchołka.
+    """
+    vertices: list[Point]
+    clusters: list[list[int]]
+    labels: list[int]
+
+    @property
+    def input_count(self) -> int:
+        return len(self.labels)
+
+    @property
+    def output_count(self) -> int:
+        return len(self.vertices)
+
+    @property
+    def removed_count(self) -> int:
+        """Liczba duplikatów usuniętych przez scalanie."""
+        return self.input_count - self.output_count
+
+    @property
+    def reduction(self) -> float:
+        """Ułamek punktów usuniętych przez scalanie (0.0 - brak redukcji)."""
+        if self.input_count == 0:
+            return 0.0
+        return self.removed_count / self.input_count
+
+
+def _cell(p: Point, eps: float) -> tuple[int, int]:
+    return math.floor(p.x / eps), math.floor(p.y / eps)
+
+
+def snap_points(points: Iterable[Point], eps: float = EPS) -> SnapResult:
+    """Scala punkty odległe o co najwyżej eps w kanoniczne wierzchołki.
+
+    Punkty są haszowane do siatki o boku eps, więc każdy wierzchołek w promieniu eps
+    leży w jednej z 9 sąsiednich komórek - nie ma porównań każdy z każdym.
+    Kanonicznym wierzchołkiem klastra jest jego pierwszy punkt (w kolejności wejścia);
+    kolejny punkt trafia do najbliższego wierzchołka w promieniu eps albo tworzy nowy.
+    Wierzchołki nie "dryfują", dzięki czemu klastry nie łączą się łańcuchowo.
+
+    Nadaje się do obróbki wyników dowolnego algorytmu wielu odcinków, np. gdy w jednym
+    węźle spotyka się wiele odcinków i ten sam punkt jest raportowany wielokrotnie.
+    """
+    if not eps > 0:
+        raise ValueError("eps musi być dodatnie")
+
+    eps2 = eps * eps
+    grid: dict[tuple[int, int], list[int]] = {}
+    vertices: list[Point] = []
+    clusters: list[list[int]] = []
+    labels: list[int] = []
+
+    for i, p in enumerate(points):
+        cx, cy = _cell(p, eps)
+
+        best = -1
+        best_d2 = eps2
+        for dx in (-1, 0, 1):
+            for dy in (-1, 0, 1):
+                for v in grid.get((cx + dx, cy + dy), ()):
+                    q = vertices[v]
+                    d2 = (p.x - q.x) ** 2 + (p.y - q.y) ** 2
+                    if d2 <= best_d2:
+                        best, best_d2 = v, d2
+
+        if best < 0:
+            best = len(vertices)
+            vertices.append(p)
+            clusters.append([])
+            grid.setdefault((cx, cy), []).append(best)
+
+        clusters[best].append(i)
+        labels.append(best)
+
+    return SnapResult(vertices, clusters, labels)
@@ -54,6 +54,27 @@ class SegmentIntersectionTests(unittest.TestCase):
         res = segment_intersection(s1, s2)
         self.assertIsInstance(res, NoIntersection)
 
+    def test_degenerate_segment_off_other(self):
+        # Rzut punktu (2.5, 0.2) nachodzi na odcinek, ale punkt na nim nie leży.
+        s1 = Segment(Point(2.5, 0.2), Point(2.5, 0.2))
+        s2 = Segment(Point(2, 0), Point(3, 1))
+        self.assertIsInstance(segment_intersection(s1, s2), NoIntersection)
+        self.assertIsInstance(segment_intersection(s2, s1), NoIntersection)
+
+    def test_degenerate_segment_on_other(self):
+        s1 = Segment(Point(2.5, 0.5), Point(2.5, 0.5))
+        s2 = Segment(Point(2, 0), Point(3, 1))
+        res = segment_intersection(s2, s1)
+        self.assertIsInstance(res, PointIntersection)
+        self.assertAlmostEqual(res.p.x, 2.5, places=7)
+        self.assertAlmostEqual(res.p.y, 0.5, places=7)
+
+    def test_two_degenerate_segments(self):
+        p = Segment(Point(1, 1), Point(1, 1))
+        self.assertIsInstance(segment_intersection(p, p), PointIntersection)
+        q = Segment(Point(1, 2), Point(1, 2))
+        self.assertIsInstance(segment_intersection(p, q), NoIntersection)
+
 
 if __name__ == "__main__":
     unittest.main(verbosity=2)
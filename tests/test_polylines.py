@@ -0,0 +1,141 @@
+import random
+import unittest
+
+from segment_intersection.geometry import (
+    NoIntersection,
+    PointIntersection,
+    SegmentIntersection,
+    segment_intersection,
+)
+from segment_intersection.models import Point, Segment
+from segment_intersection.polylines import polyline_intersections
+
+
+def _flatten(polylines):
+    coords, offsets = [], [0]
+    for pl in polylines:
+        for x, y in pl:
+            coords += [x, y]
+        offsets.append(offsets[-1] + len(pl))
+    return coords, offsets
+
+
+def _brute_force(polys_a, polys_b):
+    out = []
+    for i, pa in enumerate(polys_a):
+        for a in range(len(pa) - 1):
+            s1 = Segment(Point(*pa[a]), Point(*pa[a + 1]))
+            for j, pb in enumerate(polys_b):
+                for b in range(len(pb) - 1):
+                    s2 = Segment(Point(*pb[b]), Point(*pb[b + 1]))
+                    res = segment_intersection(s1, s2)
+                    if not isinstance(res, NoIntersection):
+                        out.append((i, a, j, b, res))
+    return out
+
+
+class PolylineIntersectionsTests(unittest.TestCase):
+    def test_zigzag_crossing_line(self):
+        zigzag = [(0, 0), (1, 2), (2, 0), (3, 2), (2.5, 3)]
+        line = [(-1, 1), (4, 1)]
+        hits = polyline_intersections(*_flatten([zigzag]), *_flatten([line]))
+        self.assertEqual([(h.i, h.a, h.j, h.b) for h in hits], [(0, 0, 0, 0), (0, 1, 0, 0), (0, 2, 0, 0)])
+        self.assertIsInstance(hits[0].result, PointIntersection)
+        self.assertAlmostEqual(hits[0].result.p.x, 0.5, places=7)
+        self.assertAlmostEqual(hits[2].result.p.x, 2.5, places=7)
+
+    def test_collinear_overlap_and_vertical_edges(self):
+        a = [(0, 0), (0, 2), (3, 2)]
+        b = [(1, 2), (5, 2), (5, -1)]
+        hits = polyline_intersections(*_flatten([a]), *_flatten([b]))
+        self.assertEqual(len(hits), 1)
+        self.assertEqual((hits[0].a, hits[0].b), (1, 0))
+        self.assertIsInstance(hits[0].result, SegmentIntersection)
+
+    def test_disjoint_bboxes_and_degenerate_polylines(self):
+        a = [[(0, 0), (1, 1)], [(5, 5)], []]
+        b = [[(10, 10), (11, 11)], [(0, 1), (1, 0)]]
+        hits = polyline_intersections(*_flatten(a), *_flatten(b))
+        self.assertEqual([(h.i, h.a, h.j, h.b) for h in hits], [(0, 0, 1, 0)])
+
+    def test_repeated_vertex_off_edge(self):
+        # Zdublowany wierzchołek (2.5, 0.2) nie leży na krawędzi (2,0)-(3,1).
+        hits = polyline_intersections([0, 0.2, 2.5, 0.2, 2.5, 0.2], [0, 3], [2, 0, 3, 1], [0, 2])
+        self.assertEqual(len(hits), 1)
+        self.assertEqual((hits[0].a, hits[0].b), (0, 0))
+        self.assertAlmostEqual(hits[0].result.p.x, 2.2, places=7)
+        self.assertAlmostEqual(hits[0].result.p.y, 0.2, places=7)
+
+    def test_repeated_vertices_on_grid(self):
+        # Oczekiwane wyniki wyznaczone ręcznie - bez porównania z wyrocznią.
+        a = [(0, 0), (2, 2), (2, 2), (4, 0), (4, 0)]
+        b = [(2, 0), (2, 2), (2, 2), (2, 4)]
+        c = [(4, 0), (4, 0)]
+        hits = polyline_intersections(*_flatten([a]), *_flatten([b, c]))
+        got = [(h.i, h.a, h.j, h.b, tuple(h.result.p)) for h in hits]
+        self.assertEqual(got, [
+            (0, 0, 0, 0, (2, 2)),
+            (0, 0, 0, 1, (2, 2)),
+            (0, 0, 0, 2, (2, 2)),
+            (0, 1, 0, 0, (2, 2)),
+            (0, 1, 0, 1, (2, 2)),
+            (0, 1, 0, 2, (2, 2)),
+            (0, 2, 0, 0, (2, 2)),
+            (0, 2, 0, 1, (2, 2)),
+            (0, 2, 0, 2, (2, 2)),
+            (0, 2, 1, 0, (4, 0)),
+            (0, 3, 1, 0, (4, 0)),
+        ])
+
+    def test_long_edge_tolerance_along_edge(self):
+        # Dla krawędzi długości 1000 segment_intersection dopuszcza przesunięcie ~1000 * EPS.
+        a = [(0, 0), (1000, 0)]
+        b = [(1000.0000005, -1), (1000.0000005, 1)]
+        hits = polyline_intersections(*_flatten([a]), *_flatten([b]))
+        self.assertEqual(len(hits), 1)
+        self.assertIsInstance(hits[0].result, PointIntersection)
+
+    def test_pair_result_does_not_depend_on_chain(self):
+        # Krótkie równoległe krawędzie odległe o 5e-5 nie przecinają się,
+        # także gdy w tym samym łańcuchu B pojawi się bardzo długa krawędź.
+        a = [0, 0, 0, 1e-5]
+        short = [5e-5, 0, 5e-5, 1e-5]
+        long = [5e-5, 1e-5, 5e-5, 1e6]
+        self.assertEqual(polyline_intersections(a, [0, 2], short, [0, 2]), [])
+        hits = polyline_intersections(a, [0, 2], short + long[2:], [0, 3])
+        self.assertNotIn((0, 0, 0, 0), [(h.i, h.a, h.j, h.b) for h in hits])
+        # Wynik dla długiej krawędzi jest taki sam jak przy badaniu jej osobno.
+        alone = polyline_intersections(a, [0, 2], long, [0, 2])
+        self.assertEqual([h.result for h in hits if h.b == 1], [h.result for h in alone])
+
+    def test_matches_brute_force(self):
+        rng = random.Random(1234)
+
+        def walk(n):
+            x, y = rng.uniform(0, 20), rng.uniform(0, 20)
+            pts = [(x, y)]
+            for _ in range(n - 1):
+                x += rng.uniform(-2, 2)
+                y += rng.uniform(-2, 2)
+                pts.append((x, y))
+            return pts
+
+        polys_a = [walk(rng.randint(2, 30)) for _ in range(15)]
+        polys_b = [walk(rng.randint(2, 30)) for _ in range(15)]
+        hits = polyline_intersections(*_flatten(polys_a), *_flatten(polys_b))
+        # Przy tej skali współrzędnych odrzucanie par nie zmienia wyniku segment_intersection.
+        expected = _brute_force(polys_a, polys_b)
+        self.assertGreater(len(expected), 0)
+        self.assertEqual([(h.i, h.a, h.j, h.b, h.result) for h in hits], expected)
+
+    def test_invalid_buffers(self):
+        with self.assertRaises(ValueError):
+            polyline_intersections([0, 0, 1], [0, 1], [0, 0, 1, 1], [0, 2])
+        with self.assertRaises(ValueError):
+            polyline_intersections([0, 0, 1, 1], [0, 1], [0, 0, 1, 1], [0, 2])
+        with self.assertRaises(ValueError):
+            polyline_intersections([0, 0, 1, 1], [0, 2, 1, 2], [0, 0, 1, 1], [0, 2])
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
@@ -0,0 +1,58 @@
+import unittest
+
+from segment_intersection.geometry import PointIntersection, segment_intersection
+from segment_intersection.models import Point, Segment
+from segment_intersection.snap import snap_points
+
+
+class SnapPointsTests(unittest.TestCase):
+    def test_junction_collapses_to_one_vertex(self):
+        # Wiele odcinków przez punkt (1/3, 1/3) - każda para daje ten sam punkt z innym błędem.
+        c = Point(1 / 3, 1 / 3)
+        segs = [
+            Segment(Point(c.x - dx, c.y - dy), Point(c.x + dx, c.y + dy))
+            for dx, dy in [(1, 0), (0, 1), (1, 1), (1, -1), (0.3, 0.7), (0.7, -0.2)]
+        ]
+        pts = []
+        for i in range(len(segs)):
+            for j in range(i + 1, len(segs)):
+                res = segment_intersection(segs[i], segs[j])
+                self.assertIsInstance(res, PointIntersection)
+                pts.append(res.p)
+
+        snapped = snap_points(pts)
+        self.assertEqual(snapped.input_count, 15)
+        self.assertEqual(snapped.output_count, 1)
+        self.assertEqual(snapped.clusters, [list(range(15))])
+        self.assertAlmostEqual(snapped.vertices[0].x, c.x, places=7)
+        self.assertAlmostEqual(snapped.reduction, 14 / 15)
+
+    def test_distant_points_stay_separate(self):
+        pts = [Point(0, 0), Point(1, 0), Point(0, 0.5e-9), Point(1, 2e-9)]
+        snapped = snap_points(pts)
+        self.assertEqual(snapped.labels, [0, 1, 0, 2])
+        self.assertEqual(snapped.clusters, [[0, 2], [1], [3]])
+        self.assertEqual(snapped.removed_count, 1)
+
+    def test_neighbouring_cells_are_checked(self):
+        # Punkty po dwóch stronach granicy komórek siatki.
+        pts = [Point(0.99, -0.01), Point(1.01, 0.01)]
+        snapped = snap_points(pts, eps=0.05)
+        self.assertEqual(snapped.output_count, 1)
+
+    def test_no_chaining(self):
+        # Odstępy 0.6 * eps: sąsiedzi są blisko, ale klaster nie rozlewa się łańcuchowo.
+        pts = [Point(0.6 * k, 0) for k in range(5)]
+        snapped = snap_points(pts, eps=1.0)
+        self.assertEqual(snapped.clusters, [[0, 1], [2, 3], [4]])
+
+    def test_empty_and_invalid_eps(self):
+        snapped = snap_points([])
+        self.assertEqual(snapped.output_count, 0)
+        self.assertEqual(snapped.reduction, 0.0)
+        with self.assertRaises(ValueError):
+            snap_points([Point(0, 0)], eps=0)
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)